@@ -1,16 +1,21 @@
 # ai_testing_app/app.py
+import asyncio
 import os
-from flask import Flask, render_template, request, redirect, url_for
+import threading
+from flask import Flask, jsonify, render_template, request, redirect, url_for
 from dotenv import load_dotenv 
 
 # Load environment variables from .env file immediately
 load_dotenv() 
 
 # Import the core logic 
-from core.ai_agent import AITestingAgent 
+from core.ai_agent import BATCH_MAX_URLS, AITestingAgent, gemini_api_keys, run_batch, warm_driver_pool 
 
 app = Flask(__name__)
 
+# Launch the pooled Chrome sessions in the background so the first test skips browser startup
+threading.Thread(target=warm_driver_pool, daemon=True).start()
+
 # --- Flask Routes ---
 
 @app.route('/', methods=['GET', 'POST'])
@@ -32,8 +37,8 @@ def run_test_and_show_report():
         return redirect(url_for('index'))
 
     # Check for API key BEFORE running the agent
-    if not os.getenv('GEMINI_API_KEY'):
-        error_msg = "FATAL ERROR: GEMINI_API_KEY not found in environment. Did you set it in Railway Variables?"
+    if not gemini_api_keys():
+        error_msg = "FATAL ERROR: GEMINI_API_KEYS / GEMINI_API_KEY not found in environment. Did you set it in Railway Variables?"
         return render_template(
             'report.html', 
             report={'url': target_url, 'actions': [{'step': 1, 'action': error_msg, 'status': 'FATAL_ERROR'}], 'summary': 'Setup Error'},
@@ -60,9 +65,26 @@ def run_test_and_show_report():
             success=False
         )
 
+@app.route('/batch')
+def run_batch_tests():
+    """Runs the AI test against several URLs (?url=...&url=...) concurrently and returns the reports as JSON."""
+    target_urls = request.args.getlist('url')
+
+    if not target_urls:
+        return jsonify({'error': 'Pass one or more ?url= parameters.'}), 400
+    if len(target_urls) > BATCH_MAX_URLS:
+        return jsonify({'error': f'At most {BATCH_MAX_URLS} URLs per batch.'}), 400
+
+    if not gemini_api_keys():
+        return jsonify({'error': 'FATAL ERROR: GEMINI_API_KEYS / GEMINI_API_KEY not found in environment. Did you set it in Railway Variables?'}), 500
+
+    return jsonify(asyncio.run(run_batch(target_urls)))
+
 
 # ✅ Required update for Railway Deployment
 if __name__ == '__main__':
     PORT = int(os.environ.get("PORT", 5000))
     print(f"✅ Flask server running on port {PORT}")
-    app.run(host='0.0.0.0', port=PORT)
+    # Threaded production server: a long-running test no longer blocks every other request
+    from waitress import serve
+    serve(app, host='0.0.0.0', port=PORT, threads=8)
@@ -1,106 +1,360 @@
 # ai_testing_app/core/ai_agent.py
+import asyncio
 import os
+import queue
+import random
+import textwrap
+import threading
 import time
+from collections import deque
+from hashlib import blake2b
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from selenium.webdriver.chrome.options import Options # NEW: For stability settings
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 
+import httpx
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 
 # --- Configuration ---
 GEMINI_MODEL = "gemini-2.5-flash" 
+PLAN_SIZE = 5 # Max actions requested from Gemini per call
+GEMINI_MAX_OUTPUT_TOKENS = 64 * PLAN_SIZE # ~64 tokens per tool call is plenty for structured output
+GEMINI_RPM = 15 # Calls per 60s window per API key, leaving headroom under the free-tier 20 RPM
+GEMINI_MAX_RETRIES = 3 # Retries on rate-limit / server errors before giving up
+DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "2")) # Pre-warmed Chrome sessions kept per process
+BATCH_MAX_URLS = 10 # Upper bound on URLs per /batch request, which holds a server thread until all finish
+
+SYSTEM_PROMPT = (
+    "You are a web testing agent: explore the site, exercise its features and look for bugs. "
+    f"Call up to {PLAN_SIZE} tools in order, preferring LINK_TEXT or ID locators; call finish_testing with your quality assessment when done."
+)
+
+# Native function calling: the model returns structured tool calls, so no response text is parsed
+_LOCATOR_ARGS = {
+    "by_type": types.Schema(type=types.Type.STRING, enum=["ID", "LINK_TEXT", "PARTIAL_LINK_TEXT", "NAME", "CSS_SELECTOR", "XPATH"]),
+    "locator": types.Schema(type=types.Type.STRING),
+}
+_TOOLS = [types.Tool(function_declarations=[
+    types.FunctionDeclaration(
+        name="click_element",
+        description="Click an element.",
+        parameters=types.Schema(type=types.Type.OBJECT, properties=_LOCATOR_ARGS, required=["by_type", "locator"]),
+    ),
+    types.FunctionDeclaration(
+        name="type_text",
+        description="Type text into an input field.",
+        parameters=types.Schema(
+            type=types.Type.OBJECT,
+            properties={**_LOCATOR_ARGS, "text": types.Schema(type=types.Type.STRING)},
+            required=["by_type", "locator", "text"],
+        ),
+    ),
+    types.FunctionDeclaration(
+        name="navigate_to",
+        description="Open a path relative to the start URL.",
+        parameters=types.Schema(type=types.Type.OBJECT, properties={"path": types.Schema(type=types.Type.STRING)}, required=["path"]),
+    ),
+    types.FunctionDeclaration(
+        name="finish_testing",
+        description="End the test with a final quality assessment and summary.",
+        parameters=types.Schema(type=types.Type.OBJECT, properties={"summary": types.Schema(type=types.Type.STRING)}, required=["summary"]),
+    ),
+])]
+_TOOL_CONFIG = types.ToolConfig(function_calling_config=types.FunctionCallingConfig(mode="ANY"))
+
+# Identical for every plan request, so it is built once instead of on every step
+_GEN_CONFIG = types.GenerateContentConfig(
+    system_instruction=SYSTEM_PROMPT,
+    tools=_TOOLS,
+    tool_config=_TOOL_CONFIG,
+    # Thinking tokens are billed and slow, and add nothing when picking a few tool calls
+    thinking_config=types.ThinkingConfig(thinking_budget=0),
+    max_output_tokens=GEMINI_MAX_OUTPUT_TOKENS,
+    temperature=0.2,
+)
+
+# Collects the first 10 labelled interactables in-page so only a small JSON list crosses the wire.
+# The current value is only used for change detection, so typing into a field counts as progress.
+# A MutationObserver (installed once per document) marks the page dirty; while nothing has changed
+# the previous scan is returned as-is instead of walking the DOM again.
+_INTERACTABLES_JS = """
+if (!window.__aiObserver) {
+    const markDirty = () => { window.__aiDirty = true; };
+    window.__aiObserver = new MutationObserver(markDirty);
+    window.__aiObserver.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    document.addEventListener('input', markDirty, true); // Typing changes .value without a DOM mutation
+    window.__aiDirty = true;
+}
+if (!window.__aiDirty) return window.__aiLast;
+window.__aiDirty = false;
+const arr = [];
+const trimmed = (v) => (v || '').trim(); // Trim each candidate so a whitespace-only label falls through to the next
+for (const el of document.querySelectorAll('a,button,input')) {
+    const l = trimmed(el.ariaLabel) || trimmed(el.innerText) || trimmed(el.placeholder) || trimmed(el.name);
+    if (l && l.length < 50) {
+        arr.push({t: el.tagName.toLowerCase(), l: l, i: el.id, v: el.value || ''});
+        if (arr.length === 10) break;
+    }
+}
+window.__aiLast = arr;
+return arr;
+"""
+
+def gemini_api_keys() -> list[str]:
+    """API keys from GEMINI_API_KEYS (comma-separated), falling back to the single GEMINI_API_KEY."""
+    keys = [k.strip() for k in os.getenv("GEMINI_API_KEYS", "").split(",") if k.strip()]
+    if not keys and os.getenv("GEMINI_API_KEY"):
+        keys = [os.getenv("GEMINI_API_KEY")]
+    return list(dict.fromkeys(keys)) # A repeated key must share one rate-limit window
+
+_NAVIGATING_ACTIONS = ("click_element", "navigate_to")
+
+# Fonts and images only: stylesheets decide visibility, which the element waits and innerText rely on.
+# Patterns must match the whole URL, so each extension is anchored to the end of the URL or to a query string.
+_BLOCKED_URL_PATTERNS = [
+    pattern
+    for ext in ('woff', 'woff2', 'ttf', 'otf', 'png', 'jpg', 'jpeg', 'gif', 'svg', 'webp')
+    for pattern in (f'*.{ext}', f'*.{ext}?*')
+]
+
+# --- WebDriver Pool ---
+# Launching Chrome takes seconds, so sessions are reused across tests instead of quit after each one
+_DRIVER_POOL = queue.Queue(maxsize=DRIVER_POOL_SIZE)
+_drivers_created = 0
+_pool_lock = threading.Lock()
+
+def _new_driver() -> webdriver.Chrome:
+    """Launches a Chrome session with the stability and speed settings the agent relies on."""
+    chrome_options = Options()
+    # Recommended arguments to fix common session errors and stabilize the browser
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--window-size=1920,1080") # Desktop layout; --start-maximized is ignored when headless
+    # Headless with no image decoding: the agent only reads tags and labels, never pixels
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.cookies': 1,
+    })
+    chrome_options.page_load_strategy = 'eager' # Return once the DOM is ready, not after every subresource
+    
+    driver = webdriver.Chrome(options=chrome_options) # Pass the options here
+    _block_heavy_resources(driver)
+    return driver
+
+def _block_heavy_resources(driver: webdriver.Chrome):
+    """Blocks fonts and images at the network layer for the driver's current tab."""
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URL_PATTERNS})
+
+def _reserve_driver_slot() -> bool:
+    """Claims room for one more Chrome session if the pool is not yet full."""
+    global _drivers_created
+    with _pool_lock:
+        if _drivers_created >= DRIVER_POOL_SIZE:
+            return False
+        _drivers_created += 1
+        return True
+
+def _release_driver_slot():
+    """Frees a slot after a driver failed to launch or was discarded."""
+    global _drivers_created
+    with _pool_lock:
+        _drivers_created -= 1
+
+def _acquire_driver() -> tuple[webdriver.Chrome, bool]:
+    """Returns (driver, pooled): an idle pooled driver, a new pooled one if there is capacity,
+    or a temporary driver (quit after use) when every pooled browser is busy."""
+    try:
+        return _DRIVER_POOL.get_nowait(), True
+    except queue.Empty:
+        pass
+    if _reserve_driver_slot():
+        try:
+            return _new_driver(), True
+        except Exception:
+            _release_driver_slot()
+            raise
+    # Pool exhausted: behave like the per-request browser rather than making the user wait
+    return _new_driver(), False
+
+def _return_driver(driver: webdriver.Chrome, origins=()):
+    """Wipes a driver's browsing state and puts it back in the pool; broken sessions are quit and their slot freed."""
+    try:
+        # A fresh tab drops sessionStorage and replaces every window or popup the tested site opened
+        old_handles = driver.window_handles
+        driver.switch_to.new_window('tab')
+        fresh_handle = driver.current_window_handle
+        for handle in old_handles:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(fresh_handle)
+        _block_heavy_resources(driver) # Network blocking is per tab
+        
+        # delete_all_cookies() only covers the current page's domain; clear the whole browser instead
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        # localStorage, IndexedDB, service workers etc. for every origin the test visited
+        for origin in origins:
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+        driver.get('about:blank')
+        _DRIVER_POOL.put_nowait(driver)
+    except Exception:
+        _release_driver_slot()
+        try:
+            driver.quit()
+        except Exception:
+            pass # Session is already dead
+
+def warm_driver_pool():
+    """Fills the pool up to DRIVER_POOL_SIZE; call from a background thread at app startup."""
+    while _reserve_driver_slot():
+        try:
+            _DRIVER_POOL.put_nowait(_new_driver())
+        except Exception as e:
+            _release_driver_slot()
+            print(f"[POOL] Failed to pre-warm WebDriver: {e}")
+            return
 
 class AITestingAgent:
     """The core AI-powered agent to autonomously test a website."""
 
+    # Shared across agents (and Flask requests) so every test reuses the same pooled HTTP/2 connections
+    _clients = None
+    _next_index = 0 # Where the next key search starts, so load rotates across keys
+    # Sliding-window rate limiter per client (i.e. per API key), shared by every agent in the process
+    _call_times = {}
+    _client_lock = threading.Lock()
+
+    @classmethod
+    def _acquire_client(cls) -> genai.Client:
+        """Returns the next Gemini client with room in its GEMINI_RPM-per-60s window, recording the call.
+
+        Sleeps only when every configured key is at its limit.
+        """
+        while True:
+            with cls._client_lock:
+                if cls._clients is None:
+                    cls._clients = [
+                        genai.Client(
+                            api_key=key,
+                            http_options=types.HttpOptions(client_args={
+                                'http2': True,
+                                'limits': httpx.Limits(max_keepalive_connections=10),
+                            }),
+                        )
+                        for key in gemini_api_keys() or [None]
+                    ]
+                now = time.monotonic()
+                wait = 60
+                for offset in range(len(cls._clients)):
+                    index = (cls._next_index + offset) % len(cls._clients)
+                    call_times = cls._call_times.setdefault(index, deque())
+                    while call_times and now - call_times[0] >= 60:
+                        call_times.popleft()
+                    if len(call_times) < GEMINI_RPM:
+                        call_times.append(now)
+                        cls._next_index = index + 1
+                        return cls._clients[index]
+                    wait = min(wait, 60 - (now - call_times[0]))
+            time.sleep(wait)
+
     def __init__(self, start_url: str):
         
-        # 1. Initialize Gemini Client (securely gets key from environment)
-        api_key = os.getenv("GEMINI_API_KEY")
-        self.client = genai.Client(api_key=api_key) 
+        # 1. Borrow a pre-warmed WebDriver from the pool (returned or quit in run_tests)
+        self.driver, self._pooled_driver = _acquire_driver()
         
-        # 2. Initialize WebDriver with Stability Fix
-        chrome_options = Options()
-        # Recommended arguments to fix common session errors and stabilize the browser
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--start-maximized") # Start maximized for better visual context
-        # chrome_options.add_argument("--headless") # Uncomment if you want it to run in the background
-        
-        self.driver = webdriver.Chrome(options=chrome_options) # Pass the options here
-        
-        # 3. Test State Variables
+        # 2. Test State Variables
         self.start_url = start_url
         self.test_report = {"url": start_url, "actions": [], "summary": ""}
-        self.history = ""
+        self.history = deque(maxlen=5) # Last few step records (O(1) append), each shortened to ~80 chars at a word boundary
         self.max_steps = 7 # Limit actions for demonstration purposes
+        self._last_dom_hash = None
+        self._last_state = None
+        self._plan = deque() # Pending AI actions, refilled when empty or after a failure
+        self._visited_origins = set() # Storage for these is wiped before the driver goes back to the pool
+        
+        # 3. Whitelist of actions the AI is allowed to call
+        self._actions = {
+            'click_element': self.click_element,
+            'type_text': self.type_text,
+            'navigate_to': self.navigate_to,
+            'finish_testing': self.finish_testing,
+        }
 
     def get_page_state(self) -> str:
         """Extracts key information from the current page for the AI to analyze."""
         url = self.driver.current_url
         title = self.driver.title
         
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-        interactable_elements = []
+        elements = self.driver.execute_script(_INTERACTABLES_JS)
         
-        for tag in soup.find_all(['a', 'button', 'input']):
-            label = tag.get('aria-label') or tag.text or tag.get('placeholder') or tag.get('name')
-            if label and len(label) < 50: 
-                 interactable_elements.append(f"<{tag.name}> Text: '{label.strip()}' ID: '{tag.get('id', 'N/A')}'")
+        # Unchanged page -> reuse the previous state; run_tests uses the same hash to detect a stuck agent
+        h = blake2b(repr((url, title, elements)).encode(), digest_size=16).digest()
+        if h == self._last_dom_hash:
+            return self._last_state
+        
+        interactable_elements = [
+            f"<{el['t']}> Text: '{el['l']}' ID: '{el['i'] or 'N/A'}'"
+            for el in elements
+        ]
         
         state = (
             f"Current URL: {url}\n"
             f"Page Title: {title}\n"
             f"Visible Interactable Elements (Top 10):\n"
-            + "\n".join(interactable_elements[:10])
+            + "\n".join(interactable_elements)
         )
+        self._last_dom_hash = h
+        self._last_state = state
         return state
 
-    def generate_action(self, page_state: str) -> str:
-        """Uses the LLM to decide the next action based on the page state and history."""
+    def generate_plan(self, page_state: str) -> list[dict]:
+        """Uses the LLM to plan the next few actions based on the page state and history."""
         
-        system_prompt = (
-            "You are a sophisticated Web Testing Agent. Your goal is to explore the website, "
-            "perform functional tests, and look for bugs. "
-            "You must respond ONLY with a single, valid Python function call from the list: "
-            "1. click_element(By.LINK_TEXT, 'About')"
-            "2. type_text(By.ID, 'search-input', 'test query')"
-            "3. navigate_to('contact')"
-            "4. finish_testing('Your final quality assessment and summary')"
-            "Analyze the page state and testing history to decide the best action. Prefer locators by visible text (LINK_TEXT) or unique ID (ID)."
-        )
-
         prompt = (
-            f"TESTING HISTORY (last 200 chars):\n{self.history[-200:]}\n\n"
-            f"CURRENT PAGE STATE:\n{page_state}\n\n"
-            "What is the single, best Python action to take next? Respond ONLY with the function call."
+            "RECENT STEPS:\n" + "\n".join(self.history) + "\n\n"
+            f"CURRENT PAGE STATE:\n{page_state}"
         )
 
         try:
-            response = self.client.models.generate_content(
-                model=GEMINI_MODEL,
-                contents=prompt, 
-                config=types.GenerateContentConfig(
-                    system_instruction=system_prompt
-                )
-            ).text.strip()
-            
-            return response
+            calls = self._call_gemini(prompt, _GEN_CONFIG)
+            return [{"name": call.name, "args": dict(call.args or {})} for call in calls]
         except Exception as e:
             self.report_action(f"Error calling Gemini: {e}", "FATAL_ERROR")
-            return "finish_testing('AI communication failed.')"
+            return [{"name": "finish_testing", "args": {"summary": "AI communication failed."}}]
+    
+    def _call_gemini(self, prompt: str, config: types.GenerateContentConfig) -> list[types.FunctionCall]:
+        """Makes a rate-limited Gemini call, retrying 429/5xx errors with exponential backoff."""
+        for attempt in range(GEMINI_MAX_RETRIES + 1):
+            # Each attempt starts from the next key, so a rate-limited key is not retried immediately
+            client = self._acquire_client()
+            try:
+                response = client.models.generate_content(
+                    model=GEMINI_MODEL,
+                    contents=prompt,
+                    config=config,
+                )
+                return (response.function_calls or [])[:PLAN_SIZE]
+            except (errors.ClientError, errors.ServerError) as e:
+                retryable = isinstance(e, errors.ServerError) or e.code == 429
+                if not retryable or attempt == GEMINI_MAX_RETRIES:
+                    raise
+                time.sleep(min(60, 2 ** attempt + random.random()))
     
     # --- Action Functions (Callable by the LLM) ---
     def click_element(self, by_type: By, locator: str):
         """Clicks an element."""
         try:
-            WebDriverWait(self.driver, 10).until(
-                lambda d: d.find_element(by_type, locator)
+            WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
+                EC.element_to_be_clickable((by_type, locator))
             ).click()
             self.report_action(f"Clicked element found by {by_type}='{locator}'.", "PASS")
         except (TimeoutException, NoSuchElementException):
@@ -109,8 +363,8 @@ class AITestingAgent:
     def type_text(self, by_type: By, locator: str, text: str):
         """Types text into an input field."""
         try:
-            element = WebDriverWait(self.driver, 10).until(
-                lambda d: d.find_element(by_type, locator)
+            element = WebDriverWait(self.driver, 10, poll_frequency=0.1).until(
+                EC.visibility_of_element_located((by_type, locator))
             )
             element.clear()
             element.send_keys(text)
@@ -131,32 +385,117 @@ class AITestingAgent:
         
     # --- Execution & Reporting ---
     
+    def _dispatch(self, action: dict):
+        """Runs one planned tool call through the action whitelist."""
+        name = action.get("name")
+        if name not in self._actions:
+            raise ValueError(f"unknown action '{name}'")
+        kwargs = dict(action.get("args", {}))
+        # Locator types arrive as By attribute names, e.g. "LINK_TEXT"
+        if "by_type" in kwargs:
+            kwargs["by_type"] = getattr(By, kwargs["by_type"])
+        return self._actions[name](**kwargs)
+
+    def _wait_for_page_settle(self, old_root):
+        """Waits for a navigation triggered by the last action (if any) to finish loading."""
+        try:
+            # Give a click-triggered navigation a moment to start; non-navigating actions just time out here
+            WebDriverWait(self.driver, 0.5, poll_frequency=0.1).until(EC.staleness_of(old_root))
+        except TimeoutException:
+            pass
+        try:
+            WebDriverWait(self.driver, 10, poll_frequency=0.1, ignored_exceptions=[StaleElementReferenceException]).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+        except TimeoutException:
+            pass # Slow page: carry on with whatever has rendered so far
+    
     def report_action(self, description: str, status: str):
         """Logs the action for the final report and updates history."""
         log = {"step": len(self.test_report['actions']) + 1, "action": description, "status": status, "url_after": self.driver.current_url}
+        parsed = urlparse(log['url_after'])
+        if parsed.scheme in ('http', 'https'):
+            self._visited_origins.add(f"{parsed.scheme}://{parsed.netloc}")
         self.test_report['actions'].append(log)
-        self.history += f"Step {log['step']} ({status}): {description}\n"
+        self.history.append(textwrap.shorten(f"Step {log['step']} ({status}): {description}", 80, placeholder="..."))
         print(f"[{status}] Step {log['step']}: {description}")
 
     def run_tests(self):
         """Main loop for autonomous testing."""
+        try:
+            return self._run_steps()
+        finally:
+            if self._pooled_driver:
+                _return_driver(self.driver, self._visited_origins)
+            else:
+                self.driver.quit()
+
+    async def run_tests_async(self):
+        """Runs run_tests in a worker thread so several agents can be awaited concurrently."""
+        return await asyncio.to_thread(self.run_tests)
+
+    def _run_steps(self):
+        """Runs the observe -> plan -> act loop until the AI finishes or max_steps is reached."""
         self.driver.get(self.start_url)
         self.report_action(f"Initial navigation to: {self.start_url}", "PASS")
         
+        unchanged_steps = 0
         for step in range(self.max_steps):
             if self.test_report['actions'] and self.test_report['actions'][-1]['status'] == "FINISH":
                 break
 
+            last_status = self.test_report['actions'][-1]['status']
+            previous_hash = self._last_dom_hash
             page_state = self.get_page_state()
-            action_code = self.generate_action(page_state)
+            # A PASS is progress even if the extracted state looks the same (e.g. typing into a textarea)
+            unchanged = self._last_dom_hash == previous_hash and last_status != "PASS"
+            unchanged_steps = unchanged_steps + 1 if unchanged else 0
+            
+            # Second failed no-op in a row: stop locally instead of paying for another Gemini call
+            if unchanged_steps >= 2:
+                self.finish_testing("Testing stopped: the page did not change after repeated actions (agent stuck).")
+                break
+            if unchanged_steps == 1:
+                self.report_action("Page unchanged after the last action; try a different locator.", "INFO")
+
+            # Re-plan only when the current plan is used up or the last action failed
+            if not self._plan or last_status in ("ERROR", "FATAL_ERROR"):
+                self._plan = deque(self.generate_plan(page_state))
+            if not self._plan:
+                self.finish_testing("AI returned an empty plan.")
+                break
+            action = self._plan.popleft()
             
             try:
-                # Execution of the AI's generated Python code
-                eval(f"self.{action_code}") 
-                time.sleep(3) 
+                # Only clicks and navigation can load a new page; typing and finishing skip the settle wait
+                navigates = action.get("name") in _NAVIGATING_ACTIONS
+                old_root = self.driver.find_element(By.TAG_NAME, 'html') if navigates else None
+                # Execution of the AI's planned action
+                self._dispatch(action)
+                if navigates:
+                    self._wait_for_page_settle(old_root)
             except Exception as e:
-                self.report_action(f"CRITICAL ERROR executing AI code '{action_code}': {e}", "FATAL_ERROR")
+                self.report_action(f"CRITICAL ERROR executing AI action {action}: {e}", "FATAL_ERROR")
                 break
         
-        self.driver.quit()
-        return self.test_report
\ No newline at end of file
+        return self.test_report
+
+
+async def run_batch(urls: list[str]) -> list[dict]:
+    """Tests several URLs concurrently, running at most DRIVER_POOL_SIZE agents at a time.
+
+    The semaphore only bounds this batch; it does not reserve pooled drivers. When /report or
+    another batch holds them, the agents here fall back to temporary browsers (see _acquire_driver).
+    """
+    limit = asyncio.Semaphore(DRIVER_POOL_SIZE)
+
+    async def run_one(url: str) -> dict:
+        async with limit:
+            try:
+                # Launching a driver blocks, so the agent is built off the event loop too
+                agent = await asyncio.to_thread(AITestingAgent, url)
+                return await agent.run_tests_async()
+            except Exception as e:
+                return {'url': url, 'actions': [{'step': 1, 'action': f"FATAL ERROR during test execution: {e}", 'status': 'FATAL_ERROR'}], 'summary': 'Execution Failed'}
+
+    return await asyncio.gather(*(run_one(url) for url in urls))